@@ -0,0 +1,11 @@
+"""Quantum checkers games.
+
+Importing this package (or its submodules) has no side effects: nothing is
+printed and no game is started. Heavy dependencies are loaded on first use.
+
+- probabilistic_checkers: checkers where every move can be split into a
+  superposition of moves. Run it with `python -m quantum_checkers.probabilistic_checkers`.
+- quantum_checkers_hexagonal: hexagonal board of entangled tiles that players
+  manipulate with quantum gates.
+- gates: gate matrices used by the hexagonal game.
+"""
@@ -0,0 +1,80 @@
+# numpy and scipy are slow to import, so the gate matrices (CNOT, X, Y, Z, h, H)
+# are built the first time one of them is used rather than when this module is
+# imported. They are still available as normal module attributes, e.g. gates.X
+
+class Gate:
+    def __init__(self, nbits, gatemat):
+        self.nbits = nbits
+        self.gatemat = gatemat
+        # TODO: finish this class and convert gates to this class
+
+def _make_gates():
+    import numpy as np
+
+    CNOT = np.array([[1,0,0,0],
+                     [0,1,0,0],
+                     [0,0,0,1],
+                     [0,0,1,0]])
+
+    X = np.array([[0, 1],
+                  [1, 0]])
+
+    Y = np.array([[0, -1j],
+                  [1j, 0]])
+
+    Z = np.array([[1, 0],
+                  [0, -1]])
+
+    h = 1/np.sqrt(2)
+
+    H = np.array([[h,  h],
+                  [h, -h]])
+
+    return {'CNOT': CNOT, 'X': X, 'Y': Y, 'Z': Z, 'h': h, 'H': H}
+
+GATE_NAMES = ('CNOT', 'X', 'Y', 'Z', 'h', 'H')
+
+# a star import looks up every name here, so it builds the gate matrices
+__all__ = ['Gate', *GATE_NAMES, 'RX', 'RY', 'RZ', 'RXX', 'RYY', 'RZZ']
+
+_gates = None
+
+def _gate(name):
+    global _gates
+    if _gates is None:
+        _gates = _make_gates()
+    return _gates[name]
+
+def __getattr__(name):
+    if name in GATE_NAMES:
+        return _gate(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(list(globals()) + list(GATE_NAMES))
+
+def _expm(mat):
+    from scipy import linalg
+    return linalg.expm(mat)
+
+def _kron(a, b):
+    import numpy as np
+    return np.kron(_gate(a), _gate(b))
+
+def RX(theta):
+    return _expm(-theta/2*1j*_gate('X'))
+
+def RY(theta):
+    return _expm(-theta/2*1j*_gate('Y'))
+
+def RZ(theta):
+    return _expm(-theta/2*1j*_gate('Z'))
+
+def RXX(theta):
+    return _expm(-theta/2*1j*_kron('X','X'))
+
+def RYY(theta):
+    return _expm(-theta/2*1j*_kron('Y','Y'))
+
+def RZZ(theta):
+    return _expm(-theta/2*1j*_kron('Z','Z'))
@@ -0,0 +1,50 @@
+"""
+Hexagonal board geometry, used by quantum_checkers_hexagonal.py.
+
+Tiles are addressed by cube coordinates (x, y, z) with x + y + z = 0. Each row
+of the board has a constant z, with z = -(size-1) at the top, and x increases
+to the right along a row. Tiles are numbered ring by ring outwards from the
+middle tile, and within a ring in order of (x, y):
+
+board indexing (size=3):
+
+    13  15  18
+  11   4   6  17
+ 9   2   0   5  16
+   8   1   3  14
+     7  10  12
+"""
+
+DIRECTIONS = [(1,-1,0), (1,0,-1), (0,1,-1), (-1,1,0), (-1,0,1), (0,-1,1)]
+
+class HexBoard:
+    def __init__(self, size, show_idxs=False):
+        # show_idxs: if True, print() labels each tile with its index
+        self.size = size
+        self.show_idxs = show_idxs
+        coords = []
+        for z in range(-size+1, size):
+            for x in range(max(-size+1, -size+1-z), min(size, size-z)):
+                coords.append((x, -x-z, z))
+        coords.sort(key=lambda xyz : (max(abs(i) for i in xyz), xyz[0], xyz[1]))
+        self.idx_to_coords = coords
+        self.coords_to_idx = {xyz : i for i,xyz in enumerate(coords)}
+
+    def get_adjacent_idxs(self, idx):
+        x,y,z = self.idx_to_coords[idx]
+        adjacent = []
+        for dx,dy,dz in DIRECTIONS:
+            xyz = (x+dx, y+dy, z+dz)
+            if xyz in self.coords_to_idx:
+                adjacent.append(self.coords_to_idx[xyz])
+        return adjacent
+
+    def print(self, label=None):
+        # label(i) gives the text to show on tile i
+        if label is None or self.show_idxs:
+            label = str
+        width = 6
+        for z in range(-self.size+1, self.size):
+            xs = range(max(-self.size+1, -self.size+1-z), min(self.size, self.size-z))
+            row = ''.join(label(self.coords_to_idx[(x, -x-z, z)]).center(width) for x in xs)
+            print(' ' * (abs(z) * width // 2) + row)
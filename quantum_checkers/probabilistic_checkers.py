@@ -1,17 +1,19 @@
 # Probabilistic checkers game - you can split your move between multiple possible moves
 
-import numpy as np
-from colorama import Fore, Style
+# numpy and colorama are imported inside the functions that use them so that
+# importing this module stays cheap and has no side effects.
+# Run `python -m quantum_checkers.probabilistic_checkers` to play in a terminal.
+
 import random
 import copy
 
 letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
 
 def empty_board(size):
+    import numpy as np
     return np.zeros((size,size), dtype='?, c8')
 
 class InvalidMove(Exception):
-    print('Invalid move.')
     pass
 
 class PlayerState:
@@ -86,20 +88,32 @@ class GameState:
         self.states = [State(size)]
     
     def measure(self):
+        import numpy as np
         probs = [s.prob for s in self.states]
         chosen_idx = np.random.choice(range(len(self.states)), p=probs)
         chosen_state = self.states[chosen_idx]
         chosen_state.prob = 1
         self.states = [chosen_state]
     
-    def score(self):
+    def calc_score(self):
         score0 = 0
         score1 = 0
         for s in self.states:
             score0 += s.player0.score * s.prob
             score1 += s.player1.score * s.prob
-        s0 = round(score0, 2)
-        s1 = round(score1, 2)
+        return [round(score0, 2), round(score1, 2)]
+
+    def winner(self):
+        # index of the winning player, or None if the game is still going
+        score = self.calc_score()
+        if score[0] < 1:
+            return 1
+        elif score[1] < 1:
+            return 0
+        return None
+
+    def score(self):
+        s0, s1 = self.calc_score()
         print('_' * 60)
         print('Score:')
         print('  Green: ' + str(s0))
@@ -108,6 +122,7 @@ class GameState:
         return [s0, s1]
     
     def expected_vals(self):
+        import numpy as np
         size = self.size
         expected_array = [np.zeros((size, size)), np.zeros((size, size))]
         for r in range(self.size):
@@ -121,6 +136,27 @@ class GameState:
     def split(self, state, p_split, update_self=True):
         self.states.append(state.split(p_split, update_self))
     
+    def check_move(self, m, playeridx):
+        # raise InvalidMove if m is not a move or jump on the board for this
+        # player, else return (attempted_jump, attempted_move)
+        if m[0] is None:
+            return (False, False)
+
+        r1, c1, r2, c2 = m[:4]
+        if not all(0 <= i < self.size for i in (r1, c1, r2, c2)):
+            raise InvalidMove()
+
+        attempted_jump = (((playeridx == 0 and r1 - r2 == 2) 
+                        or (playeridx == 1 and r2 - r1 == 2)) 
+                      and abs(c1 - c2) == 2)
+        attempted_move = (((playeridx == 0 and r1 - r2 == 1) 
+                        or (playeridx == 1 and r2 - r1 == 1)) 
+                      and abs(c1 - c2) == 1)
+
+        if not (attempted_jump or attempted_move):
+            raise InvalidMove()
+        return (attempted_jump, attempted_move)
+
     def do_move(self, m, playeridx):
         if m[0] is None:
             for state in [s for s in self.states if (not s.inactive)]:
@@ -134,15 +170,7 @@ class GameState:
         c2 = m[3]
         prob = m[4]
 
-        attempted_jump = (((playeridx == 0 and r1 - r2 == 2) 
-                        or (playeridx == 1 and r2 - r1 == 2)) 
-                      and abs(c1 - c2) == 2)
-        attempted_move = (((playeridx == 0 and r1 - r2 == 1) 
-                        or (playeridx == 1 and r2 - r1 == 1)) 
-                      and abs(c1 - c2) == 1)
-
-        if not (attempted_jump or attempted_move):
-            raise InvalidMove()
+        attempted_jump, attempted_move = self.check_move(m, playeridx)
 
         for state in [s for s in self.states if (not s.inactive)]:
             if playeridx == 0:
@@ -193,9 +221,71 @@ class GameState:
                     newopp.score -= 1
                     self.states[-1].inactive = True
         return 0
+
+    def play_turn(self, movelist, playeridx):
+        # movelist is a list of moves as returned by parse_move. The turn is
+        # split evenly between the moves; a move listed k times gets k shares.
+        # Every move is checked first so that an invalid turn changes nothing.
+        if playeridx not in (0, 1):
+            raise InvalidMove()
+        n_moves = sum(m[-1] for m in movelist)
+        if n_moves == 0:
+            raise InvalidMove()
+        for m in movelist:
+            self.check_move(m, playeridx)
+        p_move = 1/n_moves
+
+        len_states = len(self.states)
+        for m in movelist:
+            self.do_move([*m[:-1], m[-1] * p_move], playeridx)
+
+        # passes and split turns add new copies of the boards, so the old
+        # ones are dropped
+        if n_moves > 1 or movelist[0][0] is None:
+            self.states = self.states[len_states:]
+
+        for state in self.states:
+            state.inactive = False
+
+def parse_move(move):
+    # parse a move string like "a1 b2 a1 b2 p" into a list of moves for
+    # GameState.play_turn. Each entry is [r1, c1, r2, c2, count] or
+    # [None, count] for a pass, where count is the number of times it appears.
+    split_moves = move.split()
+    movelist = []
+    while len(split_moves) > 0:
+        first = split_moves[0]
+        if first == 'p':
+            movelist.append([None, 1])
+            split_moves = split_moves[1:]
+        else:
+            try:
+                second = split_moves[1]
+
+                r1 = ord(first[0]) - 97
+                c1 = int(first[1]) - 1
+
+                r2 = ord(second[0]) - 97
+                c2 = int(second[1]) - 1
+            except (IndexError, ValueError):
+                raise InvalidMove()
+
+            m = [r1, c1, r2, c2, 1]
+
+            try:
+                idx = [x[:4] for x in movelist].index(m[:4])
+                movelist[idx][-1] += 1
+            except ValueError:
+                movelist.append(m)
+
+            split_moves = split_moves[2:]
+    if len(movelist) == 0:
+        raise InvalidMove()
+    return movelist
         
 
 def print_board(game):
+    from colorama import Fore, Style
     size = game.size
     expected = game.expected_vals()
     print('')
@@ -225,6 +315,7 @@ def print_board(game):
     print()
 
 def print_boards(g):
+    from colorama import Fore, Style
     for state in g.states:
         game = GameState(g.size)
         game.states = [state]
@@ -257,6 +348,7 @@ def print_boards(g):
         print()
 
 def do_timestep(board, n=1, spreading=0.5):
+    import numpy as np
     for step in range(n):
         init_bs = np.copy(board)
         size = len(board[0][0])
@@ -276,6 +368,7 @@ def do_timestep(board, n=1, spreading=0.5):
 
 def player_move(game, playeridx):
     # TODO: add ways to split with a pass instead of another move
+    from colorama import Fore, Style
     valid_move = False
     while not valid_move:
         try:
@@ -293,56 +386,11 @@ def player_move(game, playeridx):
                 print('Player ' + str(playeridx) + ' has measured the board! ')
                 return
 
-            split_moves = move.split()
-            n_moves = 0
-            movelist = []
-            while len(split_moves) > 0:
-                first = split_moves[0]
-                if first == 'p':
-                    movelist.append([None, 1])
-                    split_moves = split_moves[1:]
-                else:
-                    try:
-                        second = split_moves[1]
-
-                        r1 = ord(first[0]) - 97
-                        c1 = int(first[1]) - 1
-
-                        r2 = ord(second[0]) - 97
-                        c2 = int(second[1]) - 1
-                    except:
-                        raise InvalidMove()
-
-                    m = [r1, c1, r2, c2, 1]
-
-                    try:
-                        idx = [x[:4] for x in movelist].index(m[:4])
-                        movelist[idx][-1] += 1
-                    except ValueError:
-                        movelist.append(m)
-                    
-                    split_moves = split_moves[2:]
-                n_moves += 1
-            
-            if n_moves == 0:
-                raise InvalidMove()
-            else:
-                p_move = 1/n_moves
-
-                len_states = len(game.states)
-                for m in movelist:
-                    m[-1] *= p_move
-                    game.do_move(m, playeridx)
-
-                if n_moves > 1:
-                    game.states = game.states[len_states:]
-
-                for state in game.states:
-                    state.inactive = False
-                
-                valid_move = True
+            game.play_turn(parse_move(move), playeridx)
+            valid_move = True
 
         except InvalidMove:
+            print('Invalid move.')
             continue
 
 def play(size=8, spreading=0.1):
@@ -362,19 +410,16 @@ def play(size=8, spreading=0.1):
         #do_timestep(b, spreading=spreading)
         print_board(game)
         player_move(game, 0)
-        score = game.score()
-        if (score[0] < 1):
-            playing = win(1)
-        elif (score[1] < 1):
-            playing = win(0)
+        game.score()
+        if game.winner() is not None:
+            playing = win(game.winner())
 
         print_board(game)
         player_move(game,1)
-        score = game.score()
-        if (score[0] < 1):
-            playing = win(1)
-        elif (score[1] < 1):
-            playing = win(0)
+        game.score()
+        if game.winner() is not None:
+            playing = win(game.winner())
     return
 
-play()
\ No newline at end of file
+if __name__ == '__main__':
+    play()
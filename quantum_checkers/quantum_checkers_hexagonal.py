@@ -1,8 +1,10 @@
-import numpy as np
-from numpy.lib.function_base import _calculate_shapes
+# numpy is imported inside the methods that use it so that importing this
+# module stays cheap.
 
-from gates import *
-from game_utils.hex_board import HexBoard
+import numbers
+
+from .gates import Gate
+from .hex_board import HexBoard
 
 """
 All tiles are entangled - i.e. the entire board is in a superposition of possible
@@ -71,6 +73,7 @@ class Board(HexBoard):
         self.make_starting_states()
     
     def make_starting_states(self):
+        import numpy as np
         # tile 0 (middle tile) is 50% chance 0 or 1
         state1 = np.zeros(self.ntiles, int)
         state1[0] = 0
@@ -106,6 +109,7 @@ class Board(HexBoard):
         return int(result)
     
     def bits_from_state_idx(self, idx):
+        import numpy as np
         bits = np.zeros(self.ntiles, int)
         for i in range(self.ntiles-1, -1, -1):
             if idx >= 2**i:
@@ -134,6 +138,7 @@ class Board(HexBoard):
             self.popstate(idx)
 
     def onebitgate(self, target, gate):
+        import numpy as np
         # TODO: use gate class instead of matrices
         states_to_rm = []
         states_to_add = []
@@ -155,6 +160,7 @@ class Board(HexBoard):
         self.prunestates()
 
     def twobitgate(self, tgtA, tgtB, gate):
+        import numpy as np
         # return False if invalid gate, else True
         # TODO: use Gate class instead of matrices
         if tgtB not in self.get_adjacent_idxs(tgtA):
@@ -185,6 +191,7 @@ class Board(HexBoard):
         return True
     
     def calc_expect(self):
+        import numpy as np
         expected_vals = np.zeros(self.ntiles)
         for idx in self.states:
             p = abs(self.states[idx])**2
@@ -209,9 +216,9 @@ class QGame():
         self.board = Board(size)
         self.score = 0
         self.deck = self.populate_deck()
-        self.params = {"handsize" : 5,
-                       "ops_per_turn" : 3,
-                       "win_threshold" : 0.9}
+        self.params = {"handsize" : handsize,
+                       "ops_per_turn" : ops_per_turn,
+                       "win_threshold" : win_threshold}
     
     def populate_deck(self, preset=None):
         # TODO
@@ -225,6 +232,42 @@ class QGame():
         p2_score = 1 - p1_score
         return (p1_score, p2_score)
 
+    def winner(self):
+        # index of the winning player, or None if the game is still going.
+        # Player 0 wants the average tile value near 0, player 1 wants it near 1
+        average = self.calc_score()[0]
+        if average <= 1 - self.params["win_threshold"]:
+            return 0
+        elif average >= self.params["win_threshold"]:
+            return 1
+        return None
+
+    def apply_gate(self, gate, *targets):
+        # apply a one- or two-bit gate (a matrix from gates.py or a Gate) to the
+        # given tiles. Returns False if the gate is not allowed, else True
+        import numpy as np
+        if isinstance(gate, Gate):
+            if gate.nbits != len(targets):
+                return False
+            gate = gate.gatemat
+        # bools are Integral but would be used as a mask instead of an index
+        if not all(isinstance(t, numbers.Integral) and not isinstance(t, bool)
+                   and 0 <= t < self.board.ntiles for t in targets):
+            return False
+        if len(targets) not in (1, 2):
+            return False
+        n = 2**len(targets)
+        if not (isinstance(gate, np.ndarray) and gate.shape == (n,n)
+                and np.issubdtype(gate.dtype, np.number)):
+            return False
+        # only unitary gates keep the board a valid quantum state
+        if not np.allclose(gate.conj().T @ gate, np.eye(n)):
+            return False
+        if len(targets) == 1:
+            self.board.onebitgate(targets[0], gate)
+            return True
+        return self.board.twobitgate(targets[0], targets[1], gate)
+
     def measure(self):
         # TODO
         # measures the board, picking a single possible state
@@ -239,4 +282,4 @@ class QGame():
     def play(self):
         # TODO
         # loop of player turns until there is a winner
-        pass
\ No newline at end of file
+        pass
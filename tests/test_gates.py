@@ -0,0 +1,9 @@
+import numpy as np
+
+
+def test_gates_star_import():
+    namespace = {}
+    exec('from quantum_checkers.gates import *', namespace)
+    for name in ['Gate', 'CNOT', 'X', 'Y', 'Z', 'h', 'H', 'RX', 'RZZ']:
+        assert name in namespace
+    assert (namespace['X'] == np.array([[0, 1], [1, 0]])).all()
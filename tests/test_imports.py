@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# worker processes import the games on every cold start, so keep this tight.
+# Measured in a fresh interpreter, each module here imports in 0.1-6 ms, while
+# `import numpy` alone takes 70-100 ms, so a module that loaded numpy eagerly
+# would blow this budget even without the sys.modules check below.
+IMPORT_BUDGET = 0.03  # seconds
+
+HEAVY_MODULES = ['numpy', 'scipy', 'colorama']
+
+
+def import_in_fresh_process(module):
+    # import `module` in a new interpreter and report the time it took
+    # and which heavy dependencies it pulled in
+    code = (
+        'import json, sys, time\n'
+        't = time.perf_counter()\n'
+        f'import {module}\n'
+        't = time.perf_counter() - t\n'
+        f'print(json.dumps([t, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[:-1] == [], 'importing printed output'
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize('module', [
+    'quantum_checkers',
+    'quantum_checkers.gates',
+    'quantum_checkers.hex_board',
+    'quantum_checkers.probabilistic_checkers',
+    'quantum_checkers.quantum_checkers_hexagonal',
+])
+def test_import_is_fast_and_lazy(module):
+    elapsed, loaded = import_in_fresh_process(module)
+    assert loaded == []
+    assert elapsed < IMPORT_BUDGET
@@ -0,0 +1,82 @@
+import pytest
+
+from quantum_checkers.probabilistic_checkers import GameState, InvalidMove, parse_move
+
+
+def board_probs(game):
+    return [s.prob for s in game.states]
+
+
+def test_parse_move():
+    assert parse_move('f2 e1') == [[5, 1, 4, 0, 1]]
+    assert parse_move('f2 e1 f2 e1 p') == [[5, 1, 4, 0, 2], [None, 1]]
+
+
+@pytest.mark.parametrize('move', ['', 'f2', 'f e1', 'fx e1'])
+def test_parse_move_rejects_malformed_input(move):
+    with pytest.raises(InvalidMove):
+        parse_move(move)
+
+
+def test_single_move():
+    game = GameState(8)
+    game.play_turn(parse_move('f2 e1'), 0)
+    assert board_probs(game) == [1]
+    assert game.expected_vals()[0][4][0] == 1
+    assert game.expected_vals()[0][5][1] == 0
+
+
+def test_split_move():
+    game = GameState(8)
+    game.play_turn(parse_move('f2 e1 f2 e3'), 0)
+    assert board_probs(game) == [0.5, 0.5]
+    assert game.expected_vals()[0][4][0] == 0.5
+    assert game.expected_vals()[0][4][2] == 0.5
+    assert not any(s.inactive for s in game.states)
+
+
+def test_pass():
+    game = GameState(8)
+    game.play_turn(parse_move('p'), 0)
+    assert board_probs(game) == [1]
+
+
+@pytest.mark.parametrize('playeridx', [-1, 2, 7])
+def test_play_turn_rejects_unknown_player(playeridx):
+    game = GameState(8)
+    with pytest.raises(InvalidMove):
+        game.play_turn(parse_move('p'), playeridx)
+    assert board_probs(game) == [1]
+
+
+@pytest.mark.parametrize('move', ['f2 e1 f2 f3', 'i2 h1', 'f0 e1', 'f2 e1 f1 e0'])
+def test_rejected_turn_leaves_game_unchanged(move):
+    game = GameState(8)
+    before = game.expected_vals()
+    with pytest.raises(InvalidMove):
+        game.play_turn(parse_move(move), 0)
+    assert board_probs(game) == [1]
+    assert not game.states[0].inactive
+    assert (game.expected_vals()[0] == before[0]).all()
+    assert (game.expected_vals()[1] == before[1]).all()
+
+
+def test_score_and_winner():
+    game = GameState(8)
+    assert game.calc_score() == [12, 12]
+    assert game.winner() is None
+    game.states[0].player1.score = 0
+    assert game.winner() == 0
+    game.states[0].player0.score = 0
+    game.states[0].player1.score = 1
+    assert game.winner() == 1
+
+
+def test_split_jump_removes_expected_fraction_of_piece():
+    game = GameState(8)
+    game.play_turn(parse_move('f2 e3'), 0)
+    game.play_turn(parse_move('c5 d4'), 1)
+    game.play_turn(parse_move('e3 c5 p'), 0)
+    assert board_probs(game) == [0.5, 0.5]
+    assert game.calc_score() == [12, 11.5]
+    assert game.expected_vals()[1][3][3] == 0.5
@@ -0,0 +1,74 @@
+import numpy as np
+
+from quantum_checkers import gates
+from quantum_checkers.quantum_checkers_hexagonal import QGame
+
+
+def test_starting_board():
+    game = QGame(size=3)
+    assert game.board.ntiles == 19
+    assert len(game.board.states) == 2
+    assert np.isclose(game.calc_score()[0], 0.5)
+    assert game.winner() is None
+
+
+def test_board_indexing_matches_diagram():
+    board = QGame(size=3).board
+    assert sorted(board.get_adjacent_idxs(0)) == [1, 2, 3, 4, 5, 6]
+    assert sorted(board.get_adjacent_idxs(18)) == [6, 15, 17]
+    assert board.coords_to_idx[(-2, 2, 0)] == 9
+
+
+def test_apply_one_bit_gate():
+    game = QGame(size=3)
+    assert game.apply_gate(gates.H, 0)
+    assert len(game.board.states) == 1
+    assert np.isclose(game.board.calc_expect()[0], 0)
+
+
+def test_apply_rotation_gates():
+    game = QGame(size=3)
+    assert game.apply_gate(gates.RX(0.3), 0)
+    assert game.apply_gate(gates.RXX(0.3), 0, 5)
+    assert np.isclose(sum(abs(amp)**2 for amp in game.board.states.values()), 1)
+
+
+def test_apply_two_bit_gate():
+    game = QGame(size=3)
+    assert game.apply_gate(gates.CNOT, 0, 5)
+    assert np.isclose(game.board.calc_expect()[5], 0.5)
+
+
+def test_apply_gate_accepts_gate_instances():
+    game = QGame(size=3)
+    assert game.apply_gate(gates.Gate(1, gates.H), 0)
+    assert game.apply_gate(gates.Gate(2, gates.CNOT), 0, 5)
+    assert np.isclose(game.board.calc_expect()[0], 0)
+
+
+def test_apply_gate_rejects_invalid_gates():
+    game = QGame(size=3)
+    states = dict(game.board.states)
+    assert not game.apply_gate(gates.CNOT, 0, 7)  # tiles not adjacent
+    assert not game.apply_gate(gates.X, 19)
+    assert not game.apply_gate(gates.X, -1)
+    assert not game.apply_gate(gates.X, 'a')
+    assert not game.apply_gate(gates.X, 0, 1)
+    assert not game.apply_gate(gates.CNOT, 0)
+    assert not game.apply_gate([[0, 1], [1, 0]], 0)
+    assert not game.apply_gate(gates.H, True)
+    assert not game.apply_gate(np.zeros((2, 2)), 0)  # not unitary
+    assert not game.apply_gate(np.eye(2) * 5, 0)
+    assert not game.apply_gate(np.zeros((4, 4)), 0, 5)
+    assert not game.apply_gate(gates.Gate(2, gates.H), 0)  # wrong nbits
+    assert not game.apply_gate(gates.Gate(1, gates.CNOT), 0)
+    assert game.board.states == states
+
+
+def test_winner_uses_win_threshold():
+    game = QGame(size=3, handsize=4, ops_per_turn=2, win_threshold=0.52)
+    assert game.params == {"handsize": 4, "ops_per_turn": 2, "win_threshold": 0.52}
+    assert game.winner() is None
+    game.apply_gate(gates.H, 0)
+    assert game.winner() == 0
+